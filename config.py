@@ -5,17 +5,23 @@ Handles environment-specific settings for local development,
 testing, and production deployment.
 """
 
+import functools
 import os
 from typing import Dict, Any
 
+# Snapshot of the environment taken once at import time. Environment variables
+# are static for the lifetime of a Cloud Function instance, so a plain dict get
+# here avoids the os.getenv function-call overhead on every lookup.
+_ENV: Dict[str, str] = dict(os.environ)
+
 
 class Config:
     """Base configuration"""
 
     # Google Cloud
-    GCP_PROJECT_ID = os.getenv('GCP_PROJECT_ID', 'portfolio-project-481815')
-    BIGQUERY_DATASET = os.getenv('BIGQUERY_DATASET', 'welltegra_historical')
-    GCP_REGION = os.getenv('GCP_REGION', 'us-central1')
+    GCP_PROJECT_ID = _ENV.get('GCP_PROJECT_ID', 'portfolio-project-481815')
+    BIGQUERY_DATASET = _ENV.get('BIGQUERY_DATASET', 'welltegra_historical')
+    GCP_REGION = _ENV.get('GCP_REGION', 'us-central1')
 
     # API Settings
     API_VERSION = 'v1'
@@ -29,15 +35,15 @@ class Config:
     ]
 
     # Rate Limiting (for future implementation)
-    RATE_LIMIT_ENABLED = os.getenv('RATE_LIMIT_ENABLED', 'false').lower() == 'true'
-    RATE_LIMIT_PER_MINUTE = int(os.getenv('RATE_LIMIT_PER_MINUTE', 60))
+    RATE_LIMIT_ENABLED = _ENV.get('RATE_LIMIT_ENABLED', 'false').lower() == 'true'
+    RATE_LIMIT_PER_MINUTE = int(_ENV.get('RATE_LIMIT_PER_MINUTE', 60))
 
     # Logging
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    LOG_LEVEL = _ENV.get('LOG_LEVEL', 'INFO')
 
     # BigQuery Settings
-    BIGQUERY_TIMEOUT_SECONDS = int(os.getenv('BIGQUERY_TIMEOUT_SECONDS', 30))
-    BIGQUERY_MAX_RESULTS = int(os.getenv('BIGQUERY_MAX_RESULTS', 1000))
+    BIGQUERY_TIMEOUT_SECONDS = int(_ENV.get('BIGQUERY_TIMEOUT_SECONDS', 30))
+    BIGQUERY_MAX_RESULTS = int(_ENV.get('BIGQUERY_MAX_RESULTS', 1000))
 
 
 class DevelopmentConfig(Config):
@@ -61,7 +67,7 @@ class TestingConfig(Config):
     TESTING = True
 
     # Use test dataset
-    BIGQUERY_DATASET = os.getenv('BIGQUERY_DATASET', 'welltegra_historical_test')
+    BIGQUERY_DATASET = _ENV.get('BIGQUERY_DATASET', 'welltegra_historical_test')
 
 
 class ProductionConfig(Config):
@@ -84,10 +90,14 @@ config: Dict[str, Any] = {
 }
 
 
+@functools.lru_cache(maxsize=8)
 def get_config(env: str = None) -> Config:
     """
     Get configuration for specified environment
 
+    Results are memoized so repeated lookups during request handling
+    return the cached Config subclass instead of re-reading the environment.
+
     Args:
         env: Environment name (development, testing, production)
 
@@ -95,6 +105,6 @@ def get_config(env: str = None) -> Config:
         Configuration object
     """
     if env is None:
-        env = os.getenv('FLASK_ENV', 'development')
+        env = _ENV.get('FLASK_ENV', 'development')
 
     return config.get(env, config['default'])
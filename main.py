@@ -7,14 +7,29 @@ with future ML prediction capabilities via Vertex AI.
 Author: Ken McKenzie
 """
 
+import functools
+import hashlib
 import os
 import json
-from flask import Flask, request, jsonify
+import threading
+import orjson
+from cachetools import TTLCache
+from dataclasses import dataclass
+from flask import Flask, request
 from flask_cors import CORS
+import google.auth
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import bigquery
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Any, Optional
 import logging
 
+try:
+    from google.cloud import bigquery_storage
+except ImportError:  # pragma: no cover - optional dependency
+    bigquery_storage = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -37,41 +52,320 @@ CORS(app, resources={
 GCP_PROJECT_ID = os.getenv('GCP_PROJECT_ID', 'portfolio-project-481815')
 BIGQUERY_DATASET = os.getenv('BIGQUERY_DATASET', 'welltegra_historical')
 
-# Initialize BigQuery client
-bq_client = bigquery.Client(project=GCP_PROJECT_ID)
+
+def _build_http_session() -> AuthorizedSession:
+    """Build an authorized session with a tuned connection pool
+
+    The default client session keeps very few connections alive, which
+    forces fresh TLS handshakes under concurrent invocations sharing a
+    Cloud Function instance.
+    """
+    credentials, _ = google.auth.default()
+    session = AuthorizedSession(credentials)
+    adapter = HTTPAdapter(
+        pool_connections=25,
+        pool_maxsize=25,
+        max_retries=Retry(total=3, backoff_factor=0.1)
+    )
+    session.mount('https://', adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=1)
+def _get_bq_client() -> bigquery.Client:
+    """Return the shared BigQuery client, created on first use
+
+    Deferring client construction keeps the ADC credential fetch off the
+    cold-start path, so requests that never touch BigQuery (the index
+    page, 404s) don't pay for it.
+    """
+    return bigquery.Client(project=GCP_PROJECT_ID, _http=_build_http_session())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_bqstorage_client():
+    """Return the shared Storage API client, or None if unavailable
+
+    The gRPC/columnar read path is much faster than REST tabledata.list
+    for large result sets, but adds connection overhead for tiny ones.
+    """
+    return bigquery_storage.BigQueryReadClient() if bigquery_storage else None
+
+
+# Result sets at or below this size are read over REST to avoid the
+# gRPC stream setup cost
+_BQSTORAGE_MIN_ROWS = 50
+
+# In-memory TTL caches for query results. The underlying tables change
+# rarely, so short TTLs cut BigQuery bytes-scanned to near zero for
+# repeated requests without risking stale data for long. TTLCache is not
+# thread-safe and handlers run on Gunicorn gthread workers, so each
+# cache has a lock held around every get and set.
+_ANALYTICS_CACHE: TTLCache = TTLCache(maxsize=16, ttl=60)
+_ANALYTICS_LOCK = threading.Lock()
+_HEALTH_CACHE: TTLCache = TTLCache(maxsize=1, ttl=10)
+_HEALTH_LOCK = threading.Lock()
+_RUNS_CACHE: TTLCache = TTLCache(maxsize=64, ttl=30)
+_RUNS_LOCK = threading.Lock()
+
+
+# ============================================
+# QUERY CONSTANTS
+# ============================================
+
+# Fully-qualified table names and query text are assembled once at import
+# so request handlers don't re-interpolate project/dataset per call
+
+_TABLE_RUNS = f"`{GCP_PROJECT_ID}.{BIGQUERY_DATASET}.toolstring_runs`"
+_TABLE_TOOLS = f"`{GCP_PROJECT_ID}.{BIGQUERY_DATASET}.toolstring_tools`"
+
+_HEALTH_QUERY = f"SELECT COUNT(*) as count FROM {_TABLE_RUNS}"
+
+# Allowed sort fields for /api/v1/runs; frozenset membership is a hash
+# lookup rather than a list scan
+_VALID_SORTS = frozenset({'total_length', 'max_od', 'tool_count', 'run_name'})
+
+# Normalize the order parameter with one dict lookup instead of
+# upper-casing and scanning a sequence
+_ORDER_MAP = {'asc': 'ASC', 'desc': 'DESC'}
+
+# One pre-assembled query per valid (sort_by, order) combination; the
+# limit is bound as a query parameter so the text never changes
+_RUNS_QUERIES = {
+    (sort_by, order): f"""
+SELECT
+    run_id,
+    run_name,
+    well_name,
+    run_date,
+    tool_count,
+    total_length,
+    max_od,
+    outcome
+FROM {_TABLE_RUNS}
+ORDER BY {sort_by} {order}
+LIMIT @limit
+"""
+    for sort_by in _VALID_SORTS
+    for order in ('ASC', 'DESC')
+}
+
+# Single round-trip for run metadata plus its tools: the correlated
+# ARRAY subquery lets BigQuery return the nested structure in one job
+# instead of paying job-submission overhead twice
+_RUN_DETAIL_QUERY = f"""
+SELECT
+    r.run_id,
+    r.run_name,
+    r.well_name,
+    r.run_date,
+    r.tool_count,
+    r.total_length,
+    r.max_od,
+    r.outcome,
+    r.lessons,
+    ARRAY(
+        SELECT AS STRUCT
+            tool_id,
+            position,
+            tool_name,
+            od,
+            neck_diameter,
+            length,
+            tool_category
+        FROM {_TABLE_TOOLS} t
+        WHERE t.run_id = r.run_id
+        ORDER BY position
+    ) AS tools
+FROM {_TABLE_RUNS} r
+WHERE r.run_id = @run_id
+"""
+
+_TOOLS_QUERY_TEMPLATE = f"""
+SELECT
+    tool_name,
+    tool_category,
+    COUNT(*) as usage_count,
+    ROUND(AVG(od), 2) as avg_od,
+    ROUND(AVG(length), 2) as avg_length,
+    ROUND(MIN(od), 2) as min_od,
+    ROUND(MAX(od), 2) as max_od
+FROM {_TABLE_TOOLS}
+{{where_clause}}
+GROUP BY tool_name, tool_category
+HAVING COUNT(*) >= @min_usage
+ORDER BY usage_count DESC, tool_name ASC
+LIMIT @limit
+"""
+
+_ANALYTICS_QUERY = f"""
+SELECT
+    COUNT(DISTINCT run_id) as total_runs,
+    COUNT(*) as total_tools,
+    ROUND(AVG(total_length), 2) as avg_toolstring_length,
+    ROUND(MAX(total_length), 2) as max_toolstring_length,
+    ROUND(AVG(max_od), 2) as avg_max_od,
+    ROUND(AVG(tool_count), 1) as avg_tools_per_run
+FROM {_TABLE_RUNS}
+"""
+
+_CATEGORY_QUERY = f"""
+SELECT
+    tool_category,
+    COUNT(*) as count,
+    ROUND(AVG(length), 2) as avg_length
+FROM {_TABLE_TOOLS}
+WHERE tool_category IS NOT NULL
+GROUP BY tool_category
+ORDER BY count DESC
+"""
 
 
 # ============================================
 # HELPER FUNCTIONS
 # ============================================
 
-def execute_query(query: str) -> List[Dict[str, Any]]:
-    """Execute BigQuery query and return results as list of dicts"""
+@functools.lru_cache(maxsize=128)
+def _run_detail_cfg(run_id: str) -> bigquery.QueryJobConfig:
+    """Return a cached QueryJobConfig binding the run_id query parameter"""
+    return bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("run_id", "STRING", run_id)
+        ],
+        use_query_cache=True
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _runs_cfg(limit: int) -> bigquery.QueryJobConfig:
+    """Return a cached QueryJobConfig binding the runs limit parameter"""
+    return bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("limit", "INT64", limit)
+        ],
+        use_query_cache=True
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _tools_cfg(category: Optional[str], min_usage: int, limit: int) -> bigquery.QueryJobConfig:
+    """Return a cached QueryJobConfig for the tools query parameters"""
+    params = [
+        bigquery.ScalarQueryParameter("min_usage", "INT64", min_usage),
+        bigquery.ScalarQueryParameter("limit", "INT64", limit)
+    ]
+    if category:
+        params.append(bigquery.ScalarQueryParameter("category", "STRING", category))
+    return bigquery.QueryJobConfig(query_parameters=params, use_query_cache=True)
+
+
+def _rows_to_dicts(results) -> List[Dict[str, Any]]:
+    """Materialize rows as dicts without per-row Python iteration
+
+    dict(row) walks Row.__iter__ at Python level per field; zipping the
+    schema keys, fetched once, with row.values() keeps the per-row work
+    in C-implemented zip and dict.
+    """
     try:
-        query_job = bq_client.query(query)
-        results = query_job.result()
+        keys = tuple(field.name for field in results.schema)
+    except AttributeError:
+        # Plain row sequences without a schema attribute
         return [dict(row) for row in results]
+    return [dict(zip(keys, row.values())) for row in results]
+
+
+def execute_query(query: str, job_config: bigquery.QueryJobConfig = None) -> List[Dict[str, Any]]:
+    """Execute BigQuery query and return results as list of dicts
+
+    Prefers the Arrow read path: RowIterator.to_arrow() plus pyarrow's
+    C-implemented to_pylist() skips the per-row Python dict construction
+    that dominates CPU on large result sets.
+    """
+    try:
+        query_job = _get_bq_client().query(query, job_config=job_config)
+        results = query_job.result()
+        try:
+            # Only construct the storage client once a result set is big
+            # enough to benefit; small results never pay for gRPC setup
+            if (results.total_rows or 0) > _BQSTORAGE_MIN_ROWS:
+                bqstorage_client = _get_bqstorage_client()
+                if bqstorage_client is not None:
+                    return results.to_arrow(bqstorage_client=bqstorage_client).to_pylist()
+            return results.to_arrow(create_bqstorage_client=False).to_pylist()
+        except (AttributeError, ValueError):
+            # Row iterators without an Arrow path (pyarrow unavailable)
+            return _rows_to_dicts(results)
     except Exception as e:
-        logger.error(f"BigQuery query failed: {e}")
+        logger.error("BigQuery query failed: %s", e)
         raise
 
 
-def build_response(status: str, data: Any = None, message: str = None, count: int = None) -> Dict:
-    """Build standardized API response"""
-    response = {"status": status}
+def json_response(payload: Any, status: int = 200, max_age: int = None):
+    """Serialize payload with orjson and wrap it in a Flask response
 
-    if data is not None:
-        response["data"] = data
+    orjson is C-implemented and handles datetimes and numpy scalars
+    natively, so it is several times faster than flask.jsonify's stdlib
+    json encoder on nested payloads.
 
-    if count is not None:
-        response["count"] = count
+    When max_age is given the response carries Cache-Control and an ETag
+    over the serialized body, and a matching If-None-Match request header
+    short-circuits to an empty 304 so browsers and Cloud CDN can skip the
+    transfer entirely.
+    """
+    body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    if max_age is None or status != 200:
+        return app.response_class(body, status=status, mimetype='application/json')
+
+    # blake2b is faster than SHA-1 in CPython and 16 bytes is plenty
+    # for a cache validator
+    etag = hashlib.blake2b(body, digest_size=16).hexdigest()
 
-    if message:
-        response["message"] = message
+    # werkzeug handles RFC 7232 quoting and If-None-Match parsing
+    # (multiple tags, weak validators, *) for us
+    if request.if_none_match.contains(etag):
+        response = app.response_class(b'', status=304, mimetype='application/json')
+    else:
+        response = app.response_class(body, status=status, mimetype='application/json')
 
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = f'public, max-age={max_age}'
     return response
 
 
+@dataclass(slots=True)
+class ApiResponse:
+    """Standardized API response envelope
+
+    A slotted positional struct is cheaper to fill than a dict built up
+    with conditional key inserts; as_payload strips unset fields so the
+    wire format stays identical to the old dict envelope.
+    """
+
+    status: str
+    data: Any = None
+    count: Optional[int] = None
+    message: Optional[str] = None
+
+    def as_payload(self) -> Dict[str, Any]:
+        """Return the envelope as a dict with unset fields omitted"""
+        return {
+            name: value
+            for name, value in (
+                ('status', self.status),
+                ('data', self.data),
+                ('count', self.count),
+                ('message', self.message)
+            )
+            if value is not None
+        }
+
+
+def build_response(status: str, data: Any = None, message: str = None, count: int = None) -> Dict:
+    """Build standardized API response"""
+    return ApiResponse(status, data, count, message).as_payload()
+
+
 # ============================================
 # API ENDPOINTS
 # ============================================
@@ -79,7 +373,7 @@ def build_response(status: str, data: Any = None, message: str = None, count: in
 @app.route('/')
 def index():
     """API documentation endpoint"""
-    return jsonify({
+    return json_response({
         "name": "WellTegra ML API",
         "version": "1.0.0",
         "description": "Cloud-native API for physics-informed industrial ML",
@@ -91,29 +385,37 @@ def index():
         },
         "documentation": "https://github.com/kenmck3772/welltegra-ml-api",
         "author": "Ken McKenzie"
-    })
+    }, max_age=60)
 
 
 @app.route('/api/v1/health')
 def health_check():
     """Health check endpoint for monitoring"""
     try:
+        with _HEALTH_LOCK:
+            cached = _HEALTH_CACHE.get('result')
+        if cached is not None:
+            return json_response(cached)
+
         # Test BigQuery connection
-        query = f"SELECT COUNT(*) as count FROM `{GCP_PROJECT_ID}.{BIGQUERY_DATASET}.toolstring_runs`"
-        result = execute_query(query)
+        result = execute_query(_HEALTH_QUERY)
 
-        return jsonify({
+        body = {
             "status": "healthy",
             "bigquery": "connected",
             "runs_count": result[0]['count'] if result else 0,
             "timestamp": "2025-12-20T12:00:00Z"
-        })
+        }
+        with _HEALTH_LOCK:
+            _HEALTH_CACHE['result'] = body
+
+        return json_response(body)
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return jsonify({
+        logger.error("Health check failed: %s", e)
+        return json_response({
             "status": "unhealthy",
             "error": str(e)
-        }), 503
+        }, 503)
 
 
 @app.route('/api/v1/runs', methods=['GET'])
@@ -127,49 +429,47 @@ def get_runs():
         order (str): Sort order (asc, desc) - default: desc
     """
     try:
-        # Parse query parameters
-        limit = request.args.get('limit', default=50, type=int)
-        sort_by = request.args.get('sort_by', default='total_length', type=str)
-        order = request.args.get('order', default='desc', type=str).upper()
+        # Parse query parameters, binding args to a local once
+        args = request.args
+        limit = args.get('limit', default=50, type=int)
+        sort_by = args.get('sort_by', default='total_length', type=str)
+        order = _ORDER_MAP.get(args.get('order', default='desc', type=str).casefold(), 'DESC')
 
         # Validate parameters
-        valid_sort_fields = ['total_length', 'max_od', 'tool_count', 'run_name']
-        if sort_by not in valid_sort_fields:
+        if sort_by not in _VALID_SORTS:
             sort_by = 'total_length'
 
-        if order not in ['ASC', 'DESC']:
-            order = 'DESC'
-
-        # Build query
-        query = f"""
-        SELECT
-            run_id,
-            run_name,
-            well_name,
-            run_date,
-            tool_count,
-            total_length,
-            max_od,
-            outcome
-        FROM `{GCP_PROJECT_ID}.{BIGQUERY_DATASET}.toolstring_runs`
-        ORDER BY {sort_by} {order}
-        LIMIT {limit}
-        """
-
-        results = execute_query(query)
-
-        return jsonify(build_response(
+        # The table is append-mostly, so a short TTL on the full response
+        # is safe for repeated listings with the same parameters
+        cache_key = (sort_by, order, limit)
+        with _RUNS_LOCK:
+            cached = _RUNS_CACHE.get(cache_key)
+        if cached is not None:
+            return json_response(cached, max_age=30)
+
+        # Look up the pre-assembled query for this sort combination;
+        # binding the limit as a parameter keeps the query text stable so
+        # BigQuery's result cache can hit across invocations
+        query = _RUNS_QUERIES[(sort_by, order)]
+
+        results = execute_query(query, job_config=_runs_cfg(limit))
+
+        response = build_response(
             status="success",
             data=results,
             count=len(results)
-        ))
+        )
+        with _RUNS_LOCK:
+            _RUNS_CACHE[cache_key] = response
+
+        return json_response(response, max_age=30)
 
     except Exception as e:
-        logger.error(f"Error fetching runs: {e}")
-        return jsonify(build_response(
+        logger.error("Error fetching runs: %s", e)
+        return json_response(build_response(
             status="error",
             message=str(e)
-        )), 500
+        ), 500)
 
 
 @app.route('/api/v1/runs/<run_id>', methods=['GET'])
@@ -181,74 +481,30 @@ def get_run_detail(run_id: str):
         run_id (str): Unique run identifier
     """
     try:
-        # Get run metadata
-        run_query = f"""
-        SELECT
-            run_id,
-            run_name,
-            well_name,
-            run_date,
-            tool_count,
-            total_length,
-            max_od,
-            outcome,
-            lessons
-        FROM `{GCP_PROJECT_ID}.{BIGQUERY_DATASET}.toolstring_runs`
-        WHERE run_id = @run_id
-        """
-
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("run_id", "STRING", run_id)
-            ]
-        )
+        job_config = _run_detail_cfg(run_id)
 
-        run_results = list(bq_client.query(run_query, job_config=job_config).result())
+        run_results = list(_get_bq_client().query(_RUN_DETAIL_QUERY, job_config=job_config).result())
 
         if not run_results:
-            return jsonify(build_response(
+            return json_response(build_response(
                 status="error",
                 message=f"Run not found: {run_id}"
-            )), 404
-
-        run_data = dict(run_results[0])
+            ), 404)
 
-        # Get tools for this run
-        tools_query = f"""
-        SELECT
-            tool_id,
-            position,
-            tool_name,
-            od,
-            neck_diameter,
-            length,
-            tool_category
-        FROM `{GCP_PROJECT_ID}.{BIGQUERY_DATASET}.toolstring_tools`
-        WHERE run_id = @run_id
-        ORDER BY position ASC
-        """
-
-        tools_results = execute_query(
-            bq_client.query(tools_query, job_config=job_config).result()
-        )
+        # The nested tools array comes back on the row itself
+        response_data = dict(run_results[0])
 
-        # Combine run and tools data
-        response_data = {
-            **run_data,
-            "tools": tools_results
-        }
-
-        return jsonify(build_response(
+        return json_response(build_response(
             status="success",
             data=response_data
-        ))
+        ), max_age=30)
 
     except Exception as e:
-        logger.error(f"Error fetching run {run_id}: {e}")
-        return jsonify(build_response(
+        logger.error("Error fetching run %s: %s", run_id, e)
+        return json_response(build_response(
             status="error",
             message=str(e)
-        )), 500
+        ), 500)
 
 
 @app.route('/api/v1/tools', methods=['GET'])
@@ -262,52 +518,32 @@ def get_tools():
         min_usage (int): Minimum usage count (default: 1)
     """
     try:
-        # Parse query parameters
-        category = request.args.get('category', type=str)
-        limit = request.args.get('limit', default=50, type=int)
-        min_usage = request.args.get('min_usage', default=1, type=int)
+        # Parse query parameters, binding args to a local once
+        args = request.args
+        category = args.get('category', type=str)
+        limit = args.get('limit', default=50, type=int)
+        min_usage = args.get('min_usage', default=1, type=int)
 
         # Build query with optional category filter
-        where_clause = ""
-        params = []
+        where_clause = "WHERE tool_category = @category" if category else ""
 
-        if category:
-            where_clause = "WHERE tool_category = @category"
-            params.append(bigquery.ScalarQueryParameter("category", "STRING", category))
+        query = _TOOLS_QUERY_TEMPLATE.format(where_clause=where_clause)
 
-        query = f"""
-        SELECT
-            tool_name,
-            tool_category,
-            COUNT(*) as usage_count,
-            ROUND(AVG(od), 2) as avg_od,
-            ROUND(AVG(length), 2) as avg_length,
-            ROUND(MIN(od), 2) as min_od,
-            ROUND(MAX(od), 2) as max_od
-        FROM `{GCP_PROJECT_ID}.{BIGQUERY_DATASET}.toolstring_tools`
-        {where_clause}
-        GROUP BY tool_name, tool_category
-        HAVING COUNT(*) >= {min_usage}
-        ORDER BY usage_count DESC, tool_name ASC
-        LIMIT {limit}
-        """
-
-        job_config = bigquery.QueryJobConfig(query_parameters=params)
-        results = list(bq_client.query(query, job_config=job_config).result())
-        results = [dict(row) for row in results]
-
-        return jsonify(build_response(
+        job_config = _tools_cfg(category, min_usage, limit)
+        results = _rows_to_dicts(_get_bq_client().query(query, job_config=job_config).result())
+
+        return json_response(build_response(
             status="success",
             data=results,
             count=len(results)
-        ))
+        ), max_age=30)
 
     except Exception as e:
-        logger.error(f"Error fetching tools: {e}")
-        return jsonify(build_response(
+        logger.error("Error fetching tools: %s", e)
+        return json_response(build_response(
             status="error",
             message=str(e)
-        )), 500
+        ), 500)
 
 
 @app.route('/api/v1/analytics', methods=['GET'])
@@ -318,70 +554,57 @@ def get_analytics():
     Returns summary statistics for the entire dataset
     """
     try:
-        query = f"""
-        SELECT
-            COUNT(DISTINCT run_id) as total_runs,
-            COUNT(*) as total_tools,
-            ROUND(AVG(total_length), 2) as avg_toolstring_length,
-            ROUND(MAX(total_length), 2) as max_toolstring_length,
-            ROUND(AVG(max_od), 2) as avg_max_od,
-            ROUND(AVG(tool_count), 1) as avg_tools_per_run
-        FROM `{GCP_PROJECT_ID}.{BIGQUERY_DATASET}.toolstring_runs`
-        """
-
-        results = execute_query(query)
+        with _ANALYTICS_LOCK:
+            cached = _ANALYTICS_CACHE.get('result')
+        if cached is not None:
+            return json_response(cached, max_age=60)
+
+        results = execute_query(_ANALYTICS_QUERY)
 
         # Get category breakdown
-        category_query = f"""
-        SELECT
-            tool_category,
-            COUNT(*) as count,
-            ROUND(AVG(length), 2) as avg_length
-        FROM `{GCP_PROJECT_ID}.{BIGQUERY_DATASET}.toolstring_tools`
-        WHERE tool_category IS NOT NULL
-        GROUP BY tool_category
-        ORDER BY count DESC
-        """
-
-        category_results = execute_query(category_query)
-
-        return jsonify(build_response(
+        category_results = execute_query(_CATEGORY_QUERY)
+
+        response = build_response(
             status="success",
             data={
                 "summary": results[0] if results else {},
                 "by_category": category_results
             }
-        ))
+        )
+        with _ANALYTICS_LOCK:
+            _ANALYTICS_CACHE['result'] = response
+
+        return json_response(response, max_age=60)
 
     except Exception as e:
-        logger.error(f"Error fetching analytics: {e}")
-        return jsonify(build_response(
+        logger.error("Error fetching analytics: %s", e)
+        return json_response(build_response(
             status="error",
             message=str(e)
-        )), 500
+        ), 500)
 
 
 # ============================================
 # ERROR HANDLERS
 # ============================================
 
+# Error bodies never change, so serialize them once at import; 404
+# storms from crawlers then cost zero allocation per response
+_NOT_FOUND_BODY = orjson.dumps({"status": "error", "message": "Endpoint not found"})
+_INTERNAL_ERROR_BODY = orjson.dumps({"status": "error", "message": "Internal server error"})
+
+
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
-    return jsonify(build_response(
-        status="error",
-        message="Endpoint not found"
-    )), 404
+    return app.response_class(_NOT_FOUND_BODY, status=404, mimetype='application/json')
 
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors"""
-    logger.error(f"Internal server error: {error}")
-    return jsonify(build_response(
-        status="error",
-        message="Internal server error"
-    )), 500
+    logger.error("Internal server error: %s", error)
+    return app.response_class(_INTERNAL_ERROR_BODY, status=500, mimetype='application/json')
 
 
 # ============================================
@@ -403,6 +626,7 @@ def api(request):
 # ============================================
 
 if __name__ == '__main__':
-    # Local development server
+    # Local development server only; containerized deploys run under
+    # Gunicorn with gthread workers (see Dockerfile)
     port = int(os.getenv('PORT', 8080))
     app.run(host='0.0.0.0', port=port, debug=True)
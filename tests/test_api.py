@@ -6,20 +6,59 @@ Tests all API endpoints with mocked BigQuery responses
 
 import pytest
 import json
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch
 import sys
 import os
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import main
 from main import app
 
 
+class FakeRow:
+    """Lightweight stand-in for bigquery.Row
+
+    Supports the mapping protocol so dict(row) works, without MagicMock's
+    per-attribute spec machinery; construction is orders of magnitude
+    cheaper across the suite.
+    """
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data):
+        self._data = data
+
+    def keys(self):
+        return self._data.keys()
+
+    def values(self):
+        return tuple(self._data.values())
+
+    def items(self):
+        return self._data.items()
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+
 @pytest.fixture
 def client():
     """Create test client"""
     app.config['TESTING'] = True
+
+    # Clear TTL caches so tests don't see responses cached by earlier tests
+    main._ANALYTICS_CACHE.clear()
+    main._HEALTH_CACHE.clear()
+    main._RUNS_CACHE.clear()
+
     with app.test_client() as client:
         yield client
 
@@ -27,8 +66,12 @@ def client():
 @pytest.fixture
 def mock_bigquery():
     """Mock BigQuery client"""
-    with patch('main.bq_client') as mock_bq:
-        yield mock_bq
+    # Also stub out the storage client so tests never construct a real
+    # BigQueryReadClient (which resolves ADC credentials) when
+    # google-cloud-bigquery-storage is installed
+    with patch('main._get_bq_client') as mock_factory, \
+            patch('main._get_bqstorage_client', return_value=None):
+        yield mock_factory.return_value
 
 
 class TestHealthEndpoint:
@@ -79,7 +122,7 @@ class TestRunsEndpoint:
         ]
 
         mock_bigquery.query.return_value.result.return_value = [
-            MagicMock(**{k: v for k, v in run.items()}) for run in mock_runs
+            FakeRow(run) for run in mock_runs
         ]
 
         response = client.get('/api/v1/runs')
@@ -140,7 +183,7 @@ class TestRunDetailEndpoint:
 
         # Mock BigQuery responses
         mock_bigquery.query.return_value.result.return_value = [
-            MagicMock(**{k: v for k, v in mock_run.items()})
+            FakeRow(mock_run)
         ]
 
         response = client.get('/api/v1/runs/byford-r16')
@@ -180,7 +223,7 @@ class TestToolsEndpoint:
         ]
 
         mock_bigquery.query.return_value.result.return_value = [
-            MagicMock(**{k: v for k, v in tool.items()}) for tool in mock_tools
+            FakeRow(tool) for tool in mock_tools
         ]
 
         response = client.get('/api/v1/tools')
@@ -224,7 +267,7 @@ class TestAnalyticsEndpoint:
         ]
 
         mock_bigquery.query.return_value.result.return_value = [
-            MagicMock(**{k: v for k, v in mock_summary.items()})
+            FakeRow(mock_summary)
         ]
 
         response = client.get('/api/v1/analytics')
@@ -249,6 +292,33 @@ class TestIndexEndpoint:
         assert 'endpoints' in data
 
 
+class TestCachingHeaders:
+    """Test ETag / Cache-Control conditional request handling"""
+
+    def test_etag_and_cache_control_emitted(self, client):
+        """Test cacheable responses carry validator and freshness headers"""
+        response = client.get('/')
+        assert response.status_code == 200
+        assert response.headers['ETag']
+        assert 'max-age=60' in response.headers['Cache-Control']
+
+    def test_if_none_match_returns_304(self, client):
+        """Test a matching If-None-Match revalidates to an empty 304"""
+        first = client.get('/')
+        etag = first.headers['ETag']
+
+        second = client.get('/', headers={'If-None-Match': etag})
+        assert second.status_code == 304
+        assert second.data == b''
+        assert second.headers['ETag'] == etag
+
+    def test_stale_if_none_match_returns_full_body(self, client):
+        """Test a non-matching If-None-Match gets the full response"""
+        response = client.get('/', headers={'If-None-Match': '"stale"'})
+        assert response.status_code == 200
+        assert response.data
+
+
 class TestErrorHandlers:
     """Test error handlers"""
 